@@ -11,6 +11,7 @@ class Args(argparse.Namespace):
     rest_put: str
     stream: bool | None
     topic: str
+    mqtt_batch: bool | None
     nmea_types: str | None
     nmea_batch_types: bool | None
     verbose: bool | None
@@ -60,6 +61,13 @@ def parse_args() -> Args:
 
     parser.add_argument("--topic", help="MQTT topic (default: kml2nmea)")
 
+    parser.add_argument(
+        "--mqtt-batch",
+        dest="mqtt_batch",
+        action="store_true",
+        help="if set, publish the messages sent to a topic in the same tick as one MQTT payload",
+    )
+
     parser.add_argument(
         "--nmea-types",
         choices=["GPRMC", "GPGGA", "GPGLL"],
@@ -11,9 +11,10 @@ class MQTTConfig:
     host: str
     port: int
     topic: str
+    batch: bool = False
 
 
-def parse_mqtt_yaml(yaml_cfg: dict[str, Any], topic: str) -> MQTTConfig:
+def parse_mqtt_yaml(yaml_cfg: dict[str, Any], topic: str, batch: bool) -> MQTTConfig:
     host = yaml_cfg.get("host")
     if not host:
         raise KeyError("Missing required 'host' in mqtt section of YAML config")
@@ -22,22 +23,29 @@ def parse_mqtt_yaml(yaml_cfg: dict[str, Any], topic: str) -> MQTTConfig:
     if not port:
         raise KeyError("Missing required 'port' in mqtt section of YAML config")
 
-    return MQTTConfig(yaml_cfg.get("enabled", False), host, port, topic)
+    return MQTTConfig(yaml_cfg.get("enabled", False), host, port, topic, batch)
 
 
 def build_mqtt_cfg(cli: Args, yaml_cfg: dict[str, Any]) -> MQTTConfig | None:
     topic = cli.topic if "topic" in cli else yaml_cfg.get("topic", DEFAULT_MQTT_TOPIC)
-    mqtt_cfg = parse_mqtt_yaml(yaml_cfg, topic) if len(yaml_cfg) else None
+    batch = bool(
+        cli.mqtt_batch if "mqtt_batch" in cli else yaml_cfg.get("batch", False)
+    )
+    mqtt_cfg = parse_mqtt_yaml(yaml_cfg, topic, batch) if len(yaml_cfg) else None
 
     if "mqtt_broker" in cli:
         if not cli.mqtt_broker and mqtt_cfg:
             # enable yaml config if exists
-            mqtt_cfg = MQTTConfig(True, mqtt_cfg.host, mqtt_cfg.port, topic)
+            mqtt_cfg = MQTTConfig(True, mqtt_cfg.host, mqtt_cfg.port, topic, batch)
         else:
             # use cli provided host:port or defaults
             host, port = parse_host_port(cli.mqtt_broker or DEFAULT_MQTT_URL)
             mqtt_cfg = MQTTConfig(
-                True, host, port, cli.topic if "topic" in cli else DEFAULT_MQTT_TOPIC
+                True,
+                host,
+                port,
+                cli.topic if "topic" in cli else DEFAULT_MQTT_TOPIC,
+                batch,
             )
 
     return mqtt_cfg
@@ -1,38 +1,60 @@
-from geographiclib.geodesic import Geodesic
-from typing import Tuple
+from pyproj import Geod
+import numpy as np
 
-_GEO: Geodesic = Geodesic.WGS84  # type: ignore[attr-defined]
+# PROJ's C port of GeographicLib; takes scalars or NumPy arrays (lon, lat order)
+_GEOD: Geod = Geod(ellps="WGS84")
 
 
-def geod_dist(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-    """Compute ellipsoidal WGS-84 distance between two (lat, lon) points in meters."""
-    return _GEO.Inverse(p1[0], p1[1], p2[0], p2[1])["s12"]
+def geod_inverse(
+    lons1: np.ndarray, lats1: np.ndarray, lons2: np.ndarray, lats2: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve each segment between two points, returning (azi12, azi21, dist_m) arrays."""
+    return _GEOD.inv(lons1, lats1, lons2, lats2)
 
 
-def geod_interp(
-    p1: Tuple[float, float], p2: Tuple[float, float], meters: float
-) -> Tuple[float, float]:
-    """Return point located *meters* along the geodesic from p1 toward p2."""
-    # calculate initial azimuth
-    az12 = _GEO.Inverse(p1[0], p1[1], p2[0], p2[1])["azi1"]
-    d = _GEO.Direct(p1[0], p1[1], az12, meters)
-    return d["lat2"], d["lon2"]
+def geod_forward(
+    lons: np.ndarray, lats: np.ndarray, azis: np.ndarray, dists: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Move each point `dists` metres along `azis`, returning (lons, lats, back_azis)."""
+    return _GEOD.fwd(lons, lats, azis, dists)
 
 
-def deg2dm(val: float, *, is_lat: bool) -> Tuple[str, str]:
-    """Convert decimal degrees to NMEA degrees+minutes string and hemisphere."""
-    hemi = ("N", "S") if is_lat else ("E", "W")
-    sign = 0 if val >= 0 else 1
-    val = abs(val)
+def geod_line_length(lons: np.ndarray, lats: np.ndarray) -> float:
+    """Return the geodesic length in metres of the polyline through the points."""
+    return _GEOD.line_length(lons, lats)
+
+
+def deg2dm_lat(val: float) -> bytes:
+    """Convert a decimal latitude to NMEA b'ddmm.mmmm,N' (or S)."""
     # split into degrees and fractional minutes
-    deg, min_ = divmod(val * 60, 60)
-    width = 2 if is_lat else 3
-    return f"{int(deg):0{width}d}{min_:07.4f}", hemi[sign]
+    deg, min_ = divmod(abs(val) * 60, 60)
+    return b"%02d%07.4f,%b" % (deg, min_, b"N" if val >= 0 else b"S")
 
 
-def checksum(payload: str) -> str:
-    """Compute XOR-based checksum for NMEA-style payload (without leading '$')."""
+def deg2dm_lon(val: float) -> bytes:
+    """Convert a decimal longitude to NMEA b'dddmm.mmmm,E' (or W)."""
+    deg, min_ = divmod(abs(val) * 60, 60)
+    return b"%03d%07.4f,%b" % (deg, min_, b"E" if val >= 0 else b"W")
+
+
+# every possible checksum suffix, shared instead of formatted per message
+_CHECKSUMS = [b"*%02X" % acc for acc in range(256)]
+
+
+def xor_bytes(data: bytes) -> int:
+    """XOR of all bytes of `data`, the partial checksum of a payload fragment."""
     acc = 0
-    for ch in payload:
-        acc ^= ord(ch)
-    return f"*{acc:02X}"
+    # iterating bytes yields ints directly, skipping a per-character ord() call
+    for b in data:
+        acc ^= b
+    return acc
+
+
+def checksum_suffix(xor: int) -> bytes:
+    """Return the b'*XX' suffix for a payload whose bytes XOR to `xor`."""
+    return _CHECKSUMS[xor]
+
+
+def checksum(payload: bytes) -> bytes:
+    """Compute XOR-based checksum for NMEA-style payload (without leading '$')."""
+    return _CHECKSUMS[xor_bytes(payload)]
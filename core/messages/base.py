@@ -16,4 +16,4 @@ class MessageContext(CallContext):
 
 class MessageBuilder(ABC):
     @abstractmethod
-    def build(self, ctx: MessageContext) -> list[str]: ...
+    def build(self, ctx: MessageContext) -> list[bytes]: ...
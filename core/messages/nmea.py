@@ -1,11 +1,34 @@
-from typing import override
+from typing import Callable, override
 from core.config import AppConfig
 from core.messages import MessageBuilder
-from core.geodesy import checksum, deg2dm
-import time
+from core.geodesy import checksum_suffix, deg2dm_lat, deg2dm_lon, xor_bytes
+from core.utils import format_hhmmss
+
+# Payload formatters per sentence type, called with (ts, pos, sog) where
+# `ts` is b"hhmmss", `pos` is b"lat,N/S,lon,E/W" and `sog` is b"knots.kk".
+# GPGGA uses fixed values: fix quality 1, 8 satellites, HDOP 1.0, altitude 0.0.
+# `ts` and `pos` must each appear verbatim exactly once: checksums are derived
+# from their XOR and the XOR of the payload without them (see NMEABuilder)
+_SENTENCES: dict[str, Callable[[bytes, bytes, bytes], bytes]] = {
+    "GPRMC": lambda ts, pos, sog: b"GPRMC,%b.00,A,%b,%b,0.0,,," % (ts, pos, sog),
+    "GPGGA": lambda ts, pos, sog: b"GPGGA,%b.00,%b,1,8,1.0,0.0,M,0.0,M,," % (ts, pos),
+    "GPGLL": lambda ts, pos, sog: b"GPGLL,%b,%b.00,A" % (pos, ts),
+}
 
 
 class NMEABuilder(MessageBuilder):
+    def __init__(self):
+        app_cfg = AppConfig.get()
+        # resolve the enabled sentences once, unsupported types are skipped
+        self._formatters = [
+            _SENTENCES[nmea] for nmea in app_cfg.nmea_types if nmea in _SENTENCES
+        ]
+        # joining only matters with more than one sentence per fix
+        self._batch = app_cfg.nmea_batch and len(self._formatters) > 1
+        self._ti = None
+        self._sog = b""
+        self._xors: list[tuple[Callable[[bytes, bytes, bytes], bytes], int]] = []
+
     @override
     def build(self, ctx):
         """
@@ -15,33 +38,31 @@ class NMEABuilder(MessageBuilder):
         ti = ctx.ti
         cfg = ti.cfg
         point = ctx.point
-        ts = time.strftime("%H%M%S", time.gmtime(ctx.epoch_s))
+        ts = format_hhmmss(ctx.epoch_s)
 
-        app_cfg = AppConfig.get()
-        nmea_types = app_cfg.nmea_types
-
-        lat_dm, ns = deg2dm(point[0], is_lat=True)
-        lon_dm, ew = deg2dm(point[1], is_lat=False)
-        sog = cfg.vel_kmh * 0.539957
-
-        msgs: list[str] = []
-        for nmea in nmea_types:
-            if nmea == "GPRMC":
-                pay = (
-                    f"GPRMC,{ts}.00,A,{lat_dm},{ns}," f"{lon_dm},{ew},{sog:.2f},0.0,,,"
-                )
-            elif nmea == "GPGGA":
-                fix_q, num_sat, hdop, alt = 1, 8, 1.0, 0.0
-                pay = (
-                    f"GPGGA,{ts}.00,"
-                    f"{lat_dm},{ns},{lon_dm},{ew},"
-                    f"{fix_q},{num_sat},{hdop:.1f},{alt:.1f},M,0.0,M,,"
-                )
-            elif nmea == "GPGLL":
-                pay = f"GPGLL,{lat_dm},{ns},{lon_dm},{ew}," f"{ts}.00,A"
-            else:
-                continue
-
-            msgs.append(f"${pay}{checksum(pay)}\r\n")
+        pos = b"%b,%b" % (deg2dm_lat(point[0]), deg2dm_lon(point[1]))
+
+        # speed over ground is fixed per track, format it once along with the
+        # XOR of everything in each payload that doesn't change between fixes
+        if ti is not self._ti:
+            self._ti = ti
+            self._sog = b"%.2f" % (cfg.vel_kmh * 0.539957)
+            self._xors = [
+                (fmt, xor_bytes(fmt(b"", b"", self._sog))) for fmt in self._formatters
+            ]
+        sog = self._sog
+
+        # XOR is order independent, so each checksum is the fixed part's XOR
+        # combined with the fix's timestamp and position, hashed only once
+        fix_xor = xor_bytes(ts) ^ xor_bytes(pos)
+
+        msgs: list[bytes] = []
+        for fmt, fixed_xor in self._xors:
+            pay = fmt(ts, pos, sog)
+            msgs.append(b"$%b%b\r\n" % (pay, checksum_suffix(fixed_xor ^ fix_xor)))
+
+        if self._batch:
+            # emit all sentences of this fix as one message
+            return [b"".join(msgs)]
 
         return msgs
@@ -1,24 +1,23 @@
 from typing import override
 from core.messages import MessageBuilder
-from core.geodesy import _GEO, checksum
-from core.utils import CallParams
-from datetime import datetime, timezone
+from core.geodesy import checksum
+from core.utils import CallParams, format_iso_ms
 import time
 
 
 class TRKParams(CallParams):
-    def __init__(self, prev_point: tuple[float, float] | None):
-        self.prev_point = prev_point
+    def __init__(self, heading: float):
+        self.heading = heading  # azimuth of travel in degrees, as yielded by walk_path
 
 
 class TRKBuilder(MessageBuilder):
     EXPECTS = [TRKParams]
 
-    def _calc_heading(
-        self, point: tuple[float, float], prev_point: tuple[float, float]
-    ) -> float:
-        d = _GEO.Inverse(prev_point[0], prev_point[1], point[0], point[1])
-        return d["azi1"] % 360
+    def __init__(self):
+        self._ti = None
+        self._name = ""
+        self._head = b""
+        self._vel = b""
 
     @override
     def build(self, ctx):
@@ -33,22 +32,25 @@ class TRKBuilder(MessageBuilder):
         epoch_s = ctx.epoch_s or time.time()
 
         # format: YYYY-MM-DDTHH:mm:ss.sssZ
-        ts = (
-            datetime.fromtimestamp(epoch_s, tz=timezone.utc)
-            .isoformat(timespec="milliseconds")
-            .replace("+00:00", "Z")
+        ts = format_iso_ms(epoch_s)
+
+        # Heading (bearing) normalized to [0, 360)
+        azi = ctx.get(TRKParams).heading % 360
+
+        # fields fixed per track, formatted again only once the track is renamed
+        if ti is not self._ti or ti.name != self._name:
+            self._ti = ti
+            self._name = ti.name
+            self._head = b"TRK,%b,%b," % (ti.name.encode(), cfg.source.encode())
+            self._vel = b"%.1f" % cfg.vel_kmh
+
+        payload = b"%b%b,%.6f,%.6f,%b,%d" % (
+            self._head,
+            ts,
+            point[0],
+            point[1],
+            self._vel,
+            int(azi),
         )
 
-        # Calculate heading (bearing)
-        azi = 0.0
-        prev_point = ctx.get(TRKParams).prev_point
-        if prev_point:
-            azi = self._calc_heading(ctx.point, prev_point)
-
-        payload = (
-            f"TRK,{ti.name},{cfg.source},{ts},"
-            f"{point[0]:.6f},{point[1]:.6f},"
-            f"{cfg.vel_kmh:.1f},{int(azi)}"
-        )
-
-        return [f"${payload}{checksum(payload)}\r\n"]
+        return [b"$%b%b\r\n" % (payload, checksum(payload))]
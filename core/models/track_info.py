@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Literal
+import numpy as np
 
 TrackMode = Literal["trk-nmea", "trk-truck", "trk-container"]
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackCfg:
     vel_kmh: float
     interval_ms: int
@@ -18,12 +19,17 @@ class TrackCfg:
     prov: str
     comune: str
 
+    @property
+    def step_m(self) -> float:
+        """Distance travelled between two consecutive fixes, in metres."""
+        return self.vel_kmh / 3.6 * (self.interval_ms / 1000)
 
-@dataclass
+
+@dataclass(slots=True)
 class TrackInfo:
     name: str
     cfg: TrackCfg
-    coords: list[tuple[float, float]]
+    coords: np.ndarray  # (N, 2) array of (lat, lon)
     total_dist: float
     path: str
     raw_name: str
@@ -3,21 +3,70 @@ from core.config import AppConfig
 from core.walker import total_path_distance
 from core.utils import get_cod_prov, get_cod_comune
 from lxml import etree as ET
-import re
+from typing import Callable, Iterator
+import numpy as np
 
 _NS = {"k": "http://www.opengis.net/kml/2.2"}
-_RE = re.compile(r'^\s*(?:"([^"]+)"|(\S+))(.*)$')
+# compiled once instead of resolving path and namespaces on every find()
+_PLACEMARKS = ET.XPath("k:Placemark", namespaces=_NS)
+_NAME = ET.XPath("k:name", namespaces=_NS)
+_COORDINATES = ET.XPath("k:LineString/k:coordinates", namespaces=_NS)
+_POINT = ET.XPath("k:Point", namespaces=_NS)
+_FLAGS = ("loop", "repeat")
+
+_SETTERS: dict[str, Callable[[TrackCfg, str], None]] = {
+    "velocity": lambda cfg, v: setattr(cfg, "vel_kmh", float(v)),
+    "interval": lambda cfg, v: setattr(cfg, "interval_ms", int(v)),
+    "delay": lambda cfg, v: setattr(cfg, "delay_ms", int(v)),
+    "mode": lambda cfg, v: setattr(cfg, "mode", v.lower()),
+    "source": lambda cfg, v: setattr(cfg, "source", v.lower()),
+    "id-port": lambda cfg, v: setattr(cfg, "id_port", v),
+    "dest-port": lambda cfg, v: setattr(cfg, "dest_port", v.upper()),
+    "prov": lambda cfg, v: setattr(cfg, "prov", v),
+    "comune": lambda cfg, v: setattr(cfg, "comune", v),
+}
+
+_MODE_ALIAS = {
+    "sea": "trk-nmea",
+    "nmea": "trk-nmea",
+    "trk-nmea": "trk-nmea",
+    "land": "trk-truck",
+    "trk-truck": "trk-truck",
+    "trk-container": "trk-container",
+}
 
 DEFAULT_ID_PORT = "001"
 DEFAULT_DESTINATION_PORT = "A01"
 
-parser = ET.XMLParser(remove_blank_text=True)
+
+def _split_name(text: str) -> tuple[str, str] | None:
+    """
+    Split a KML <name> string into the track name, quoted or the first word, and
+    the rest holding its tokens. Returns None if there is no name.
+    """
+    start = len(text) - len(text.lstrip())
+    if start == len(text):
+        return None
+
+    end = text.find('"', start + 1) if text[start] == '"' else -1
+    if end > start + 1:
+        name = text[start + 1 : end]
+        rest = text[end + 1 :]
+    else:
+        # unquoted, or an empty/unclosed quote that is taken verbatim
+        name = text[start:].split(None, 1)[0]
+        rest = text[start + len(name) :]
+
+    # tokens fit on one line
+    if "\n" in rest.removesuffix("\n"):
+        return None
+    return name, rest
 
 
 def parse_cfg_in_name_tags(text: str) -> tuple[str, TrackCfg]:
     """Parse a KML <name> string into (name, TrackCfg), reading inline tokens."""
-    m = _RE.match(text)
-    if not m:
+    split = _split_name(text)
+    if split is None:
         raise ValueError(f"Invalid name/text: {text!r}")
 
     default_cfg = AppConfig.get().default_track_cfg
@@ -35,81 +84,72 @@ def parse_cfg_in_name_tags(text: str) -> tuple[str, TrackCfg]:
         comune="",
     )
 
-    name = m.group(1) or m.group(2)
-    seen_interval = False
-    seen_source = False
-
-    # iterate tokens like 'velocity=30', 'interval=500', 'mode=trk-container'
-    for tok in m.group(3).split():
-        if "=" in tok:
-            k, v = tok.split("=", 1)
-            if k == "velocity":
-                cfg.vel_kmh = float(v)
-            elif k == "interval":
-                cfg.interval_ms = int(v)
-                seen_interval = True
-            elif k == "delay":
-                cfg.delay_ms = int(v)
-            elif k == "mode":
-                cfg.mode = v.lower()
-            elif k == "source":
-                cfg.source = v.lower()
-                seen_source = True
-            elif k == "id-port":
-                cfg.id_port = v
-            elif k == "dest-port":
-                cfg.dest_port = v.upper()
-            elif k == "prov":
-                cfg.prov = v
-            elif k == "comune":
-                cfg.comune = v
-        else:
-            if tok == "loop":
-                cfg.loop = True
-            elif tok == "repeat":
-                cfg.repeat = True
+    name, rest = split
+    seen = set()
+
+    # one pass over tokens like 'velocity=30', 'interval=500', 'loop'
+    for token in rest.split():
+        i = token.find("=")
+        if i > 0:
+            key = token[:i]
+            if setter := _SETTERS.get(key):
+                setter(cfg, token[i + 1 :])
+                seen.add(key)
+        elif token in _FLAGS:
+            setattr(cfg, token, True)
 
     # normalize mode names
-    lm = cfg.mode.lower()
-    if lm in ("sea", "nmea", "trk-nmea"):
-        cfg.mode = "trk-nmea"
-    elif lm in ("land", "trk-truck"):
-        cfg.mode = "trk-truck"
-    elif lm in ("trk-container",):
-        cfg.mode = "trk-container"
+    cfg.mode = _MODE_ALIAS.get(cfg.mode.lower(), cfg.mode)
 
     # default interval for container if not overridden
-    if cfg.mode == "trk-container" and not seen_interval:
+    if cfg.mode == "trk-container" and "interval" not in seen:
         cfg.interval_ms = 60_000
 
     # normalize source vehicle for NMEA mode
-    if cfg.source == "truck" and not seen_source:
+    if cfg.source == "truck" and "source" not in seen:
         cfg.source = "ship"
 
     return name, cfg
 
 
+def parse_coordinates(text: str) -> np.ndarray:
+    """
+    Parse a KML <coordinates> string of "lon,lat[,alt]" tuples into an (N, 2) array of (lat, lon).
+    """
+    tuples = text.split()
+    if not tuples:
+        return np.empty((0, 2), dtype=np.float64)
+
+    # tuples of a LineString normally share the same number of components
+    ncomp = tuples[0].count(",") + 1
+    values = np.fromstring(text.replace(",", " "), dtype=np.float64, sep=" ")
+    # tuples have 2 or 3 components, so the count only adds up if all of them
+    # match the first; otherwise mixed lon,lat and lon,lat,alt are taken one by one
+    if values.size != ncomp * len(tuples):
+        return np.array([t.split(",")[1::-1] for t in tuples], dtype=np.float64)
+
+    # keep lon,lat and swap them into lat,lon
+    return values.reshape(-1, ncomp)[:, 1::-1].copy()
+
+
+def _first(xpath: ET.XPath, el: ET._Element) -> ET._Element | None:
+    found = xpath(el)
+    return found[0] if found else None
+
+
 def parse_main_placemark(
     pm: ET._Element,
-) -> tuple[str, str, TrackCfg, list[tuple[float, float]]] | None:
+) -> tuple[str, str, TrackCfg, np.ndarray] | None:
     """
     Parse main placemark of a folder element, returning a tuple of (raw_name,vehicle_name,cfg,coords).
     """
-    name_el = pm.find("k:name", _NS)
-    line_el = pm.find("k:LineString", _NS)
-    if name_el is None or line_el is None:
+    name_el = _first(_NAME, pm)
+    coord_el = _first(_COORDINATES, pm)
+    if name_el is None or coord_el is None:
         return
 
     # parse coordinate tuples (lon,lat) -> (lat,lon)
-    coord_el = line_el.find("k:coordinates", _NS)
-    if coord_el is None:
-        return
-
-    coords: list[tuple[float, float]] = []
-    for c in (coord_el.text or "").split():
-        parts = c.split(",")
-        lon, lat = map(float, parts[:2])
-        coords.append((lat, lon))
+    coords = parse_coordinates(coord_el.text or "")
 
     raw_name = (name_el.text or "").strip()
     vehicle_name, cfg = parse_cfg_in_name_tags(raw_name)
@@ -117,9 +157,7 @@ def parse_main_placemark(
     return (raw_name, vehicle_name, cfg, coords)
 
 
-def parse_driving_placemarks(
-    pms: list[ET._Element], tracks: list[TrackInfo], path: str
-) -> None:
+def parse_driving_placemarks(pms: list[ET._Element], path: str) -> TrackInfo | None:
     results = parse_main_placemark(pms[0])
     if results is None:
         return
@@ -127,13 +165,13 @@ def parse_driving_placemarks(
     raw_name, vehicle_name, cfg, coords = results
 
     # Parse starting and ending placemark
-    start_el: ET._Element = pms[1].find("k:name", _NS)
-    end_el: ET._Element = pms[-1].find("k:name", _NS)
+    start_el: ET._Element = _first(_NAME, pms[1])
+    end_el: ET._Element = _first(_NAME, pms[-1])
 
     cfg.prov = get_cod_prov(start_el.text, cfg.prov) or ""
     cfg.comune = get_cod_comune(start_el.text, cfg.comune) or ""
 
-    ti = TrackInfo(
+    return TrackInfo(
         name=vehicle_name,
         cfg=cfg,
         coords=coords,
@@ -144,19 +182,15 @@ def parse_driving_placemarks(
         end_placemark=end_el.text,
     )
 
-    tracks.append(ti)
-
 
-def parse_lines_placemarks(
-    pms: list[ET._Element], tracks: list[TrackInfo], path: str
-) -> None:
+def parse_lines_placemarks(pms: list[ET._Element], path: str) -> Iterator[TrackInfo]:
     for pm in pms:
         results = parse_main_placemark(pm)
         if results is None:
             continue
 
         raw_name, vehicle_name, cfg, coords = results
-        ti = TrackInfo(
+        yield TrackInfo(
             name=vehicle_name,
             cfg=cfg,
             coords=coords,
@@ -167,13 +201,16 @@ def parse_lines_placemarks(
             end_placemark=None,
         )
 
-        tracks.append(ti)
-
 
-def parse_tracks(path: str) -> list[TrackInfo]:
-    tracks: list[TrackInfo] = []
-
-    for folder in ET.parse(path, parser).iterfind(".//k:Folder", _NS):
+def parse_tracks(path: str) -> Iterator[TrackInfo]:
+    # Stream the document folder by folder instead of building the whole tree
+    # first; a folder's end event fires once all of its placemarks are parsed
+    for _, folder in ET.iterparse(
+        path,
+        events=("end",),
+        tag=f"{{{_NS['k']}}}Folder",
+        remove_blank_text=True,
+    ):
         folder: ET._Element
         # 1. Find all <Placemark> in a <Folder>
         # 2. Check if <Folder> is a driving route or routes of lines
@@ -181,15 +218,16 @@ def parse_tracks(path: str) -> list[TrackInfo]:
         # 3. If driving route then parse Placemark and starting/ending Placemarks
         #    (There could be Placemarks in between so take the last Placemark for ending)
         # 4. If routes of lines, parse each Placemark
-        pms: list[ET._Element] = folder.findall("k:Placemark", _NS)
-
-        if len(pms) == 0:
-            continue
-
-        is_driving_route = len(pms) >= 2 and pms[1].find("k:Point", _NS) is not None
-        if is_driving_route:
-            parse_driving_placemarks(pms, tracks, path)
-        else:
-            parse_lines_placemarks(pms, tracks, path)
-
-    return tracks
+        pms: list[ET._Element] = _PLACEMARKS(folder)
+
+        if len(pms) > 0:
+            is_driving_route = len(pms) >= 2 and bool(_POINT(pms[1]))
+            if is_driving_route:
+                ti = parse_driving_placemarks(pms, path)
+                if ti:
+                    yield ti
+            else:
+                yield from parse_lines_placemarks(pms, path)
+
+        # Only the extracted tracks are kept, free the folder's subtree
+        folder.clear(keep_tail=True)
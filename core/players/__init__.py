@@ -1,3 +1,4 @@
 from .base import *
 from .instant import *
 from .simulated import *
+from .ticker import *
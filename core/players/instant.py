@@ -1,13 +1,36 @@
 from typing import override
+from concurrent.futures import Executor
 from core.config import AppConfig
-from core.messages import MessageContext, TRKParams
-from core.transports import TransportContext, SingleFileTransport, TimestampParam
+from core.messages import MessageBuilder, MessageContext, TRKParams, get_builder
+from core.models import TrackInfo
+from core.transports import Transport, TransportContext, TimestampParam
 from core.walker import walk_path
 from .base import TrackPlayer
+import asyncio
 import time
 
 
+def _render_track(ti: TrackInfo) -> list[tuple[float, bytes]]:
+    # builders hold per-process state, so each worker makes its own
+    player = InstantPlayer(ti, get_builder(ti.cfg.mode), [])
+    return list(player.generate_messages())
+
+
 class InstantPlayer(TrackPlayer):
+    def __init__(
+        self,
+        ti: TrackInfo,
+        builder: MessageBuilder,
+        transports: list[Transport],
+        executor: Executor | None = None,
+    ):
+        """
+        When `executor` is given, messages are rendered there and only
+        handed to the transports in this process.
+        """
+        super().__init__(ti, builder, transports)
+        self.executor = executor
+
     def generate_messages(self):
         """Yields (timestamp, raw_payload_bytes) in track-order."""
         ti = self.ti
@@ -15,22 +38,20 @@ class InstantPlayer(TrackPlayer):
 
         start = time.time() + cfg.delay_ms / 1000
         step_s = cfg.interval_ms / 1000
-        step_m = cfg.vel_kmh / 3.6 * step_s
 
-        prev_point = None
-        for idx, point in enumerate(walk_path(ti.coords, step_m, cfg.loop)):
+        for idx, (lat, lon, azi) in enumerate(
+            walk_path(ti.coords, cfg.step_m, cfg.loop)
+        ):
             epoch_s = start + idx * step_s
-            ctx = MessageContext(self.ti, point, epoch_s)
+            ctx = MessageContext(self.ti, (lat, lon), epoch_s)
 
             if ti.cfg.mode != "trk-nmea":
-                ctx.set(TRKParams(prev_point))
+                ctx.set(TRKParams(azi))
 
             msgs = self.builder.build(ctx)
 
             for m in msgs:
-                yield epoch_s, m.encode()
-
-            prev_point = point
+                yield epoch_s, m
 
     @override
     async def play(self):
@@ -39,19 +60,20 @@ class InstantPlayer(TrackPlayer):
         self._emitter.emit("start", self.ti)
         await self._emitter.wait_for_complete()
 
-        for ts, payload in self.generate_messages():
-            for t in self.transports:
-                ctx = TransportContext(self.ti, payload)
+        with_ts = bool(app_cfg.filegen and app_cfg.filegen.mode == "single")
+        if self.executor:
+            loop = asyncio.get_running_loop()
+            messages = await loop.run_in_executor(self.executor, _render_track, self.ti)
+        else:
+            messages = self.generate_messages()
 
-                if app_cfg.filegen and app_cfg.filegen.mode == "single":
-                    ctx.set(TimestampParam(ts))
+        for ts, payload in messages:
+            ctx = TransportContext(self.ti, payload)
+            if with_ts:
+                ctx.set(TimestampParam(ts))
 
+            for t in self.transports:
                 t.send(ctx)
 
         self._emitter.emit("end", self.ti)
         await self._emitter.wait_for_complete()
-
-        # hacky solution for now to flush data from single file transport
-        for t in self.transports:
-            if isinstance(t, SingleFileTransport):
-                t.flush()
@@ -1,46 +1,92 @@
 import asyncio
 from typing import override
-from core.messages import MessageContext, TRKParams
-from core.transports import TransportContext
-from core.walker import walk_path
+from core.messages import MessageBuilder, MessageContext, TRKParams
+from core.models import TrackInfo
+from core.transports import Transport, TransportContext
+from core.walker import Route, compute_route, iter_route
 from .base import TrackPlayer
+from .ticker import Ticker
 
 
 class SimulatedPlayer(TrackPlayer):
+    def __init__(
+        self,
+        ti: TrackInfo,
+        builder: MessageBuilder,
+        transports: list[Transport],
+        route: Route | None = None,
+    ):
+        """`route` takes the track's fixes when computed ahead, see `compute_routes`."""
+        super().__init__(ti, builder, transports)
+        self.route = route
+
     @override
     async def play(self):
-        cfg = self.ti.cfg
-        step = cfg.vel_kmh / 3.6 * (cfg.interval_ms / 1000)
+        ti = self.ti
+        cfg = ti.cfg
+        interval = cfg.interval_ms / 1000
+
+        # loop invariants, kept as locals for the per-fix path
+        with_heading = cfg.mode != "trk-nmea"
+        build = self.builder.build
+        transports = self.transports
+
+        # the fixes only depend on the track's geometry and speed, so compute
+        # them once up front and replay them on every repeat; they stay in the
+        # (shared) arrays and are read out lazily on each lap
+        route = self.route or compute_route(ti.coords, cfg.step_m, cfg.loop, cache=True)
+
+        # per-track contexts, refilled on every fix instead of reallocated;
+        # streaming transports are done with them once send_many returns
+        ctx = MessageContext(ti, (float(route[0][0]), float(route[1][0])))
+        heading = TRKParams(0.0)
+        if with_heading:
+            ctx.set(heading)
+        ctxs: list[TransportContext] = []
 
         await asyncio.sleep(cfg.delay_ms / 1000)
 
-        while True:
-            self._emitter.emit("start", self.ti)
-            await self._emitter.wait_for_complete()
+        self._emitter.emit("start", self.ti)
+        await self._emitter.wait_for_complete()
 
-            prev_point = None
-            for point in walk_path(self.ti.coords, step, cfg.loop):
-                ctx = MessageContext(self.ti, point)
+        # tracks with the same interval and start phase share one timer; only
+        # the track's first fix goes out right away, every later one (first
+        # fixes of repeated laps included) waits for the tick one interval after
+        # the previous fix, so lap handlers don't shift the cadence
+        start = asyncio.get_running_loop().time()
+        with Ticker.get(interval, start) as ticker:
+            last = None
+            while True:
+                for lat, lon, azi in iter_route(route):
+                    if last is None:
+                        last = start
+                    else:
+                        last = await ticker.wait(last + interval)
 
-                if cfg.mode != "trk-nmea":
-                    ctx.set(TRKParams(prev_point))
+                    ctx.point = (lat, lon)
+                    heading.heading = azi
 
-                msgs = self.builder.build(ctx)
-                for t in self.transports:
-                    for m in msgs:
-                        t.send(TransportContext(self.ti, m.encode()))
+                    msgs = build(ctx)
 
-                await asyncio.sleep(cfg.interval_ms / 1000)
+                    # every transport gets the same contexts
+                    if len(ctxs) != len(msgs):
+                        ctxs = [TransportContext(ti, m) for m in msgs]
+                    else:
+                        for tctx, m in zip(ctxs, msgs):
+                            tctx.payload = m
 
-                prev_point = point
+                    for t in transports:
+                        t.send_many(ctxs)
 
-            self._emitter.emit("finish", self.ti)
-            await self._emitter.wait_for_complete()
-            if not cfg.repeat:
-                break
-            else:
-                self._emitter.emit("repeat", self.ti)
+                self._emitter.emit("finish", self.ti)
                 await self._emitter.wait_for_complete()
+                if not cfg.repeat:
+                    break
+                else:
+                    self._emitter.emit("repeat", self.ti)
+                    await self._emitter.wait_for_complete()
+                    self._emitter.emit("start", self.ti)
+                    await self._emitter.wait_for_complete()
 
     def repeat(self):
         """
@@ -0,0 +1,77 @@
+import asyncio
+from typing import ClassVar
+
+
+class Ticker:
+    """
+    Shared clock for all tracks with the same interval and start phase: one timer
+    fires per tick and wakes every subscribed track, instead of one timer per track.
+
+    Usage:
+        start = loop.time()
+        with Ticker.get(interval, start) as ticker:
+            last = start
+            while ...:
+                last = await ticker.wait(last + interval)
+    """
+
+    _tickers: ClassVar[dict[tuple[float, int], "Ticker"]] = {}
+
+    def __init__(self, key: tuple[float, int], interval: float, origin: float):
+        self.interval = interval
+        self._key = key
+        self._origin = origin
+        self._tick = origin
+        self._event = asyncio.Event()
+        self._subscribers = 0
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def get(cls, interval: float, start: float) -> "Ticker":
+        """
+        Return the ticker shared by every track ticking every `interval` seconds
+        on the same grid as a track starting at loop time `start`.
+        """
+        # phase of the start on the interval's grid, to the millisecond: tracks
+        # starting off-grid (delays, late REST starts) get a ticker of their own
+        interval_ms = max(round(interval * 1000), 1)
+        key = (interval, round(start * 1000) % interval_ms)
+        if key not in cls._tickers:
+            cls._tickers[key] = cls(key, interval, start)
+        return cls._tickers[key]
+
+    def __enter__(self) -> "Ticker":
+        self._subscribers += 1
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def __exit__(self, *exc):
+        self._subscribers -= 1
+
+    async def _run(self):
+        # fire on fixed deadlines so waking the tracks doesn't add up as drift
+        loop = asyncio.get_running_loop()
+        next_fire = self._origin
+        while self._subscribers:
+            next_fire += self.interval
+            await asyncio.sleep(max(0, next_fire - loop.time()))
+            # set() wakes every current waiter, clear() arms the next tick
+            self._tick = next_fire
+            self._event.set()
+            self._event.clear()
+
+        self._task = None
+        del self._tickers[self._key]
+
+    async def wait(self, due: float) -> float:
+        """
+        Wait for the first tick at or after loop time `due`, return the time it
+        was scheduled for.
+        """
+        # a track's grid matches the ticker's only to the millisecond, so a tick
+        # more than half an interval early belongs to the previous step
+        while True:
+            await self._event.wait()
+            if self._tick > due - self.interval / 2:
+                return self._tick
@@ -0,0 +1,22 @@
+from concurrent.futures import ProcessPoolExecutor
+from core.config import AppConfig
+import multiprocessing
+
+
+def _init_worker(app_cfg: AppConfig):
+    # spawned workers start without the singleton
+    try:
+        AppConfig.get()
+    except RuntimeError:
+        AppConfig.init(app_cfg)
+
+
+def create_process_pool() -> ProcessPoolExecutor:
+    """Process pool whose workers share this process's AppConfig."""
+    # spawn, not fork: the parent may already run threads (e.g. MQTT's
+    # network loop) and forking a multi-threaded process can deadlock
+    return ProcessPoolExecutor(
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(AppConfig.get(),),
+    )
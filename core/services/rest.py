@@ -62,7 +62,7 @@ class RESTService(Service):
                 cod_prov=ti.cfg.prov,
                 cod_comune=ti.cfg.comune,
                 destination_port=ti.cfg.dest_port,
-                gps_position=ti.coords[0],
+                gps_position=tuple(ti.coords[0].tolist()),
                 documents=None,
                 start_date=now_str,
                 operation_date=now_str,
@@ -36,7 +36,9 @@ class ServiceManager:
             if cfg.filegen.streaming:
                 self.transports.append(MultiFilesTransport(cfg.filegen.outdir))
             else:
-                self.instant_transports.append(MultiFilesTransport(cfg.filegen.outdir))
+                self.instant_transports.append(
+                    MultiFilesTransport(cfg.filegen.outdir, large_buffer=True)
+                )
 
         if cfg.udp and cfg.udp.enabled:
             print("Added transport: UDPTransport")
@@ -45,7 +47,9 @@ class ServiceManager:
         if cfg.mqtt and cfg.mqtt.enabled:
             print("Added transport: MQTTTransport")
             self.transports.append(
-                MQTTTransport((cfg.mqtt.host, cfg.mqtt.port), cfg.mqtt.topic)
+                MQTTTransport(
+                    (cfg.mqtt.host, cfg.mqtt.port), cfg.mqtt.topic, cfg.mqtt.batch
+                )
             )
 
     def register(self, service: Service):
@@ -55,6 +59,9 @@ class ServiceManager:
         self.services.append(service)
 
     async def start_all(self):
+        for transport in self.transports + self.instant_transports:
+            await transport.open()
+
         tasks = []
         for service in self.services:
             print(f"Started service: {service.__class__.__name__}")
@@ -4,28 +4,75 @@ from core.messages import get_builder
 from typing import override
 from core.config import AppConfig
 from core.utils import run_tasks_with_error_logging
+from core.walker import compute_routes
+from core.pool import create_process_pool
+from concurrent.futures import Executor
 import asyncio
 
+# estimated fixes (over all instant tracks) from which rendering in worker
+# processes wins back their startup, each re-importing numpy, pyproj and lxml
+# (~0.3 s); rendering runs at a few microseconds per fix in-process
+_PARALLEL_RENDER_FIXES = 500_000
+
 
 class StreamingService(Service):
     def __init__(self):
         self._tasks: list[asyncio.Task] = []
+        self._executor: Executor | None = None
+
+    async def _flush_when_done(self, tasks: list[asyncio.Task]):
+        # instant transports may buffer across tracks, write out once all are played
+        await asyncio.wait(tasks)
+        for t in self.instant_transports:
+            t.flush()
+
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
 
     @override
     async def start(self):
-        for ti in self.tm.values():
+        instant_tasks: list[asyncio.Task] = []
+        tracks = list(self.tm.values())
+
+        # small or single-track loads are cheaper to render in-process than to
+        # ship around
+        if self.instant_transports and len(tracks) > 1:
+            fixes = sum(
+                ti.total_dist / ti.cfg.step_m for ti in tracks if ti.cfg.step_m > 0
+            )
+            if fixes >= _PARALLEL_RENDER_FIXES:
+                self._executor = create_process_pool()
+
+        # every simulated route in one batch of geodesic calls; tracks that can't
+        # be walked get no route and fail in their own player, not the batch
+        routes = [None] * len(tracks)
+        if self.transports:
+            routes = compute_routes(
+                [(ti.coords, ti.cfg.step_m, ti.cfg.loop) for ti in tracks], cache=True
+            )
+
+        for ti, route in zip(tracks, routes):
             print(f"▶ {ti.name}: {ti.cfg}")
             builder = get_builder(ti.cfg.mode)
 
             cfg = AppConfig.get()
 
             if self.transports:
-                player = SimulatedPlayer(ti, builder, self.transports)
+                player = SimulatedPlayer(ti, builder, self.transports, route)
                 self._tasks.append(asyncio.create_task(player.play()))
 
             if self.instant_transports:
-                player = InstantPlayer(ti, builder, self.instant_transports)
-                self._tasks.append(asyncio.create_task(player.play()))
+                player = InstantPlayer(
+                    ti, builder, self.instant_transports, self._executor
+                )
+                instant_tasks.append(asyncio.create_task(player.play()))
+
+        if instant_tasks:
+            self._tasks.extend(instant_tasks)
+            self._tasks.append(
+                asyncio.create_task(self._flush_when_done(instant_tasks))
+            )
 
         await run_tasks_with_error_logging(self._tasks)
 
@@ -37,3 +84,7 @@ class StreamingService(Service):
         # ensure all cancellations are processed
         await run_tasks_with_error_logging(self._tasks)
         self._tasks.clear()
+
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -17,8 +17,19 @@ class TransportContext(CallContext):
 
 
 class Transport(ABC):
+    async def open(self) -> None:
+        """Acquire resources that need a running event loop; called once before sending."""
+
     @abstractmethod
     def send(self, ctx: TransportContext) -> None: ...
 
+    def flush(self) -> None:
+        """Write out anything the transport buffers; called once all tracks are sent."""
+
+    def send_many(self, ctxs: list[TransportContext]) -> None:
+        """Send several messages at once; override if the transport can batch them."""
+        for ctx in ctxs:
+            self.send(ctx)
+
     @abstractmethod
     def close(self) -> None: ...
@@ -1,7 +1,9 @@
 from .base import Transport
+import asyncio
 from typing import override, cast
 import paho.mqtt.client as mqtt
 from core.config import AppConfig
+from core.models import TrackInfo
 from urllib.parse import urlparse
 
 
@@ -19,21 +21,62 @@ class MQTTTransport(Transport):
         self.client.ws_set_options(path=path)
         self.client.connect(host, port)
 
-    def __init__(self, broker: tuple[str, int], topic: str):
+    def __init__(self, broker: tuple[str, int], topic: str, batch: bool = False):
+        """
+        With `batch`, messages sent to the same topic within one loop iteration are
+        published as a single payload; every message already ends with CRLF.
+        """
         self.topic = topic
+        self.batch = batch
+        self._topics: dict[tuple[str, str], str] = {}
+        self._pending: dict[str, list[bytes]] = {}
         if broker[0].startswith(("ws", "wss")):
             self._init_ws_client(broker[0])
         else:
             self.client = mqtt.Client()
             self.client.connect(*broker)
 
+        # network I/O (acks, keepalive pings) runs on paho's background thread,
+        # publish() only queues the packet
+        self.client.loop_start()
+
+    def _topic(self, ti: TrackInfo) -> str:
+        """Return the track's topic, built once per (mode, id_port) pair."""
+        key = (ti.cfg.mode, ti.cfg.id_port)
+        topic = self._topics.get(key)
+        if topic is None:
+            topic = self._topics[key] = f"{self.topic}/{key[0]}/{key[1]}"
+        return topic
+
     @override
     def send(self, ctx):
-        topic = f"{self.topic}/{ctx.ti.cfg.mode}/{ctx.ti.cfg.id_port}"
-        self.client.publish(topic, ctx.payload)
-        if AppConfig.get().verbose:
-            print(f"[MQTT:{topic}] {ctx.payload.decode()}")
+        self.send_many([ctx])
+
+    def _queue(self, topic: str, payload: bytes):
+        if not self._pending:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._pending.setdefault(topic, []).append(payload)
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        for topic, payloads in pending.items():
+            self.client.publish(topic, b"".join(payloads), qos=0)
+
+    @override
+    def send_many(self, ctxs):
+        verbose = AppConfig.get().verbose
+        for ctx in ctxs:
+            topic = self._topic(ctx.ti)
+            if self.batch:
+                self._queue(topic, ctx.payload)
+            else:
+                self.client.publish(topic, ctx.payload, qos=0)
+
+            if verbose:
+                print(f"[MQTT:{topic}] {ctx.payload.decode()}")
 
     @override
     def close(self):
+        self._flush()
         self.client.disconnect()
+        self.client.loop_stop()
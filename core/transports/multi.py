@@ -1,13 +1,18 @@
 from .base import Transport
-from typing import TextIO, override
+from typing import BinaryIO, override
 import os
 import re
 
 
 class MultiFilesTransport(Transport):
-    def __init__(self, outdir: str):
+    def __init__(self, outdir: str, large_buffer: bool = False):
+        """
+        `large_buffer` writes lines in big chunks, for instant generation only:
+        streaming never flushes, so its files keep the default buffer.
+        """
         self.outdir = outdir
-        self.outfiles: dict[str, TextIO] = {}
+        self.buffering = 1 << 20 if large_buffer else -1
+        self.outfiles: dict[str, BinaryIO] = {}
         os.makedirs(outdir, exist_ok=True)
 
     @override
@@ -22,9 +27,14 @@ class MultiFilesTransport(Transport):
             safe = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower()
             ext = ".trk" if cfg.mode.startswith("trk") else ".nmea"
             path = os.path.join(self.outdir, f"{kmlbase}.{safe}{ext}")
-            self.outfiles[name] = open(path, "w")
+            self.outfiles[name] = open(path, "wb", buffering=self.buffering)
 
-        self.outfiles[ti.name].write(ctx.payload.decode())
+        self.outfiles[ti.name].write(ctx.payload)
+
+    @override
+    def flush(self):
+        for of in self.outfiles.values():
+            of.flush()
 
     @override
     def close(self):
@@ -1,5 +1,6 @@
 from .base import Transport, TimestampParam
 from typing import override
+import heapq
 import os
 
 
@@ -9,19 +10,23 @@ class SingleFileTransport(Transport):
     def __init__(self, outfile: str):
         od = os.path.dirname(outfile) or "."
         os.makedirs(od, exist_ok=True)
-        self.outfile = open(outfile, "w", buffering=1)
-        self.buffer: list[tuple[float, bytes]] = []
+        self.outfile = open(outfile, "wb")
+        # per-track buffers, each already in timestamp order as tracks are played
+        self.buffers: dict[str, list[tuple[float, bytes]]] = {}
 
     @override
     def send(self, ctx):
         ctx.validate(self.EXPECTS)
         ts = ctx.get(TimestampParam).timestamp
-        self.buffer.append((ts, ctx.payload))
+        self.buffers.setdefault(ctx.ti.name, []).append((ts, ctx.payload))
 
+    @override
     def flush(self):
-        self.buffer.sort(key=lambda x: x[0])
-        for _, payload in self.buffer:
-            self.outfile.write(payload.decode())
+        # k-way merge of the sorted track buffers instead of sorting everything
+        merged = heapq.merge(*self.buffers.values(), key=lambda x: x[0])
+        self.outfile.writelines(payload for _, payload in merged)
+        self.outfile.flush()
+        self.buffers.clear()
 
     @override
     def close(self):
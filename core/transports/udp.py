@@ -1,20 +1,143 @@
+import asyncio
+import ctypes
 import socket
+import sys
 from .base import Transport
 from typing import override
 from core.config import AppConfig
 
 
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """Return libc's sendmmsg(2) if available (Linux only), otherwise None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [
+        ctypes.c_int,
+        ctypes.POINTER(_MMsgHdr),
+        ctypes.c_uint,
+        ctypes.c_int,
+    ]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+
+# datagrams per sendmmsg(2) call, larger batches barely save more
+_MAX_BATCH = 64
+
+# kernel send buffer, large enough to absorb a full flush of many tracks
+_SNDBUF = 1 << 20
+
+
 class UDPTransport(Transport):
     def __init__(self, host: str, port: int):
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.target = (host, port)
+        self._transport: asyncio.DatagramTransport | None = None
+        self._pending: list[bytes] = []
+
+    @override
+    async def open(self):
+        # the endpoint is connected to the target, so sendto() needs no address
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=self.target, family=socket.AF_INET
+        )
+        sock = self._transport.get_extra_info("socket")
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF)
+        except OSError:
+            # best effort, the kernel default still works
+            pass
+
+    @property
+    def transport(self) -> asyncio.DatagramTransport:
+        if self._transport is None:
+            raise RuntimeError("UDPTransport is not opened.")
+        return self._transport
+
+    def _sendmmsg(self, payloads: list[bytes]) -> int:
+        """Try to send all payloads with one sendmmsg(2) call, return how many were sent."""
+        # anything queued in the transport must go out first to keep the order
+        if _sendmmsg is None or self.transport.get_write_buffer_size():
+            return 0
+
+        n = len(payloads)
+        iovs = (_IOVec * n)()
+        msgs = (_MMsgHdr * n)()
+        for i, payload in enumerate(payloads):
+            iovs[i].iov_base = ctypes.cast(ctypes.c_char_p(payload), ctypes.c_void_p)
+            iovs[i].iov_len = len(payload)
+            msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+            msgs[i].msg_hdr.msg_iovlen = 1
+
+        sock = self.transport.get_extra_info("socket")
+        # on error (e.g. EAGAIN) nothing is sent, the transport handles the retry
+        return max(_sendmmsg(sock.fileno(), msgs, n, 0), 0)
+
+    def _queue(self, payloads: list[bytes]):
+        # tracks firing in the same loop iteration share one flush, and so
+        # their datagrams share sendmmsg(2) calls
+        if not self._pending:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._pending.extend(payloads)
+
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        if not pending or self._transport is None:
+            return
+
+        for i in range(0, len(pending), _MAX_BATCH):
+            batch = pending[i : i + _MAX_BATCH]
+            sent = self._sendmmsg(batch) if len(batch) > 1 else 0
+
+            # whatever sendmmsg did not take goes through the (buffering) transport
+            for payload in batch[sent:]:
+                self.transport.sendto(payload)
 
     @override
     def send(self, ctx):
-        self.sock.sendto(ctx.payload, self.target)
+        self._queue([ctx.payload])
         if AppConfig.get().verbose:
             print(f"[UDP] {ctx.payload.decode()}")
 
+    @override
+    def send_many(self, ctxs):
+        """Queue all datagrams, they go out with sendmmsg(2) where supported."""
+        payloads = [ctx.payload for ctx in ctxs]
+        self._queue(payloads)
+
+        if AppConfig.get().verbose:
+            for payload in payloads:
+                print(f"[UDP] {payload.decode()}")
+
     @override
     def close(self):
-        self.sock.close()
+        if self._transport:
+            self._flush()
+            self._transport.close()
+            self._transport = None
@@ -1,3 +1,37 @@
+from datetime import datetime, timezone
+import math
+import time
+
+# Last formatted second per format, shared by all tracks ticking in that second
+_TS_CACHE: dict[str, tuple[int, bytes]] = {"hhmmss": (-1, b""), "iso": (-1, b"")}
+
+
 def parse_host_port(hostname: str) -> tuple[str, int]:
     host, port = hostname.split(":")
     return (host, int(port))
+
+
+def format_hhmmss(epoch_s: float | None = None) -> bytes:
+    """Format a UTC epoch (now if None) as NMEA b'hhmmss'."""
+    sec = int(time.time() if epoch_s is None else epoch_s)
+    cached_sec, ts = _TS_CACHE["hhmmss"]
+    if sec != cached_sec:
+        ts = time.strftime("%H%M%S", time.gmtime(sec)).encode()
+        _TS_CACHE["hhmmss"] = (sec, ts)
+    return ts
+
+
+def format_iso_ms(epoch_s: float) -> bytes:
+    """Format a UTC epoch as b'YYYY-MM-DDTHH:mm:ss.sssZ'."""
+    # split like datetime.fromtimestamp does: microseconds rounded half-even
+    frac, whole = math.modf(epoch_s)
+    sec, us = int(whole), round(frac * 1e6)
+    if us >= 1_000_000:
+        sec, us = sec + 1, us - 1_000_000
+
+    cached_sec, ts = _TS_CACHE["iso"]
+    if sec != cached_sec:
+        dt = datetime.fromtimestamp(sec, tz=timezone.utc)
+        ts = dt.strftime("%Y-%m-%dT%H:%M:%S").encode()
+        _TS_CACHE["iso"] = (sec, ts)
+    return b"%b.%03dZ" % (ts, us // 1000)
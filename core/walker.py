@@ -1,51 +1,162 @@
-from typing import List, Tuple, Iterator
-from core.geodesy import geod_dist, geod_interp
+from typing import Tuple, Iterator
+from core.geodesy import geod_forward, geod_inverse, geod_line_length
+import numpy as np
 
+Route = Tuple[np.ndarray, np.ndarray, np.ndarray]
 
-def walk_path(
-    points: List[Tuple[float, float]], step_m: float, loop: bool
-) -> Iterator[Tuple[float, float]]:
-    """Yield points every `step_m` metres along the polyline; include endpoints."""
-    if loop:
-        # reverse for ping-pong behavior
-        points = points + points[-2::-1]
+# fixes converted to Python floats at a time when iterating a route
+_ITER_CHUNK = 1024
+
+# streamed routes by (id(points), step_m, loop), at most one per track and
+# step; the points array is kept alongside so its id can't be reused while
+# the entry lives
+_ROUTES: dict[Tuple[int, float, bool], Tuple[np.ndarray, Route]] = {}
+
+
+def _is_walkable(points: np.ndarray, step_m: float) -> bool:
+    # a route needs a segment to walk and a step that moves along it
+    return len(points) >= 2 and step_m > 0
+
+
+def compute_route(
+    points: np.ndarray, step_m: float, loop: bool, cache: bool = False
+) -> Route:
+    """
+    Compute every fix placed `step_m` metres apart along the (N, 2) array of (lat, lon)
+    points, endpoints included. Returns the (lats, lons, azimuths) arrays of the fixes,
+    where the azimuth is the heading of travel at that fix, in degrees from north.
+    Raises ValueError for fewer than 2 points or a step that isn't positive.
+    """
+    if not _is_walkable(points, step_m):
+        raise ValueError(
+            f"Cannot walk {len(points)} point(s) in steps of {step_m} m, "
+            "a route needs at least 2 points and a positive velocity"
+        )
+    return compute_routes([(points, step_m, loop)], cache)[0]
+
+
+def compute_routes(
+    tracks: list[Tuple[np.ndarray, float, bool]], cache: bool = False
+) -> list[Route | None]:
+    """
+    Same as `compute_route` for many (points, step_m, loop) tracks at once, sharing
+    one inverse and one forward geodesic call among all of them. Tracks that can't be
+    walked get None instead of a route, so they don't fail the others.
+
+    With `cache`, routes are memoized for the life of the process, so every streaming
+    player of the same track shares its (read-only) arrays. Meant for routes that are
+    replayed, not for one-off renders.
+    """
+    walkable = [_is_walkable(p, step_m) for p, step_m, _ in tracks]
+    batch = [t for t, ok in zip(tracks, walkable) if ok]
+    solved = iter(_cached_routes(batch) if cache else _solve_routes(batch))
+    return [next(solved) if ok else None for ok in walkable]
+
+
+def _cached_routes(tracks: list[Tuple[np.ndarray, float, bool]]) -> list[Route]:
+    keys = [(id(p), step_m, loop) for p, step_m, loop in tracks]
+    missing = {k: t for k, t in zip(keys, tracks) if k not in _ROUTES}
+    routes = _solve_routes(list(missing.values()))
+    for (k, t), route in zip(missing.items(), routes):
+        for arr in route:
+            arr.setflags(write=False)
+        _ROUTES[k] = (t[0], route)
 
-    carry = 0.0  # leftover from previous segment
-    cur = points[0]
-    yield cur  # always yield first point
+    return [_ROUTES[k][1] for k in keys]
 
-    for nxt in points[1:]:
-        seg_len = geod_dist(cur, nxt)
-        if seg_len == 0:
-            continue
-        # initial offset on this segment
-        dist_from_cur = step_m - carry
-        while dist_from_cur < seg_len:
-            fix = geod_interp(cur, nxt, dist_from_cur)
-            yield fix
-            dist_from_cur += step_m
-        # compute new carry into next segment
-        carry = seg_len - (dist_from_cur - step_m)
-        cur = nxt
 
-    yield points[-1]  # ensure final endpoint is emitted
+def _solve_routes(tracks: list[Tuple[np.ndarray, float, bool]]) -> list[Route]:
+    """Solve the routes of `compute_routes`, bypassing the cache."""
+    if not tracks:
+        return []
 
+    # reverse for ping-pong behavior
+    paths = [np.concatenate((p, p[-2::-1])) if loop else p for p, _, loop in tracks]
+    offsets = np.cumsum([0] + [len(p) for p in paths])
+    points = np.concatenate(paths)
+    lats = points[:, 0]
+    lons = points[:, 1]
 
-from typing import List, Tuple
-from core.geodesy import geod_dist
+    # all segment azimuths and lengths in one call; the segments joining one
+    # track's end to the next track's start are computed too, but never used
+    all_az12, all_az21, all_lens = geod_inverse(
+        lons[:-1], lats[:-1], lons[1:], lats[1:]
+    )
+
+    fix_segs = []
+    fix_offs = []
+    for (_, step_m, _), first, end in zip(tracks, offsets, offsets[1:]):
+        seg_lens = all_lens[first : end - 1]
+
+        # fixes sit every step_m metres from the start (strictly before the end), so
+        # locate each one on its segment through the cumulative distances
+        seg_starts = np.concatenate(([0.0], np.cumsum(seg_lens)))
+        dists = np.arange(step_m, seg_starts[-1], step_m)
+        # "right" skips zero-length segments sharing the same start
+        seg = np.searchsorted(seg_starts, dists, side="right") - 1
+
+        fix_segs.append(seg + first)
+        fix_offs.append(dists - seg_starts[seg])
+
+    # all fixes of all routes in one call
+    seg = np.concatenate(fix_segs)
+    all_fix_lons, all_fix_lats, all_back_azis = geod_forward(
+        lons[seg], lats[seg], all_az12[seg], np.concatenate(fix_offs)
+    )
+
+    routes = []
+    fix_start = 0
+    for first, end, track_segs in zip(offsets, offsets[1:], fix_segs):
+        fixes = slice(fix_start, fix_start + len(track_segs))
+        fix_start = fixes.stop
+
+        az12 = all_az12[first : end - 1]
+        az21 = all_az21[first : end - 1]
+
+        # endpoints take the heading of the first and last non-empty segments
+        moving = np.flatnonzero(all_lens[first : end - 1] > 0)
+        first_azi = az12[moving[0]] if len(moving) else 0.0
+        last_azi = az21[moving[-1]] + 180.0 if len(moving) else first_azi
+
+        routes.append(
+            (
+                np.concatenate(([lats[first]], all_fix_lats[fixes], [lats[end - 1]])),
+                np.concatenate(([lons[first]], all_fix_lons[fixes], [lons[end - 1]])),
+                # forward azimuth at each fix is its back azimuth turned around
+                np.concatenate(([first_azi], all_back_azis[fixes] + 180.0, [last_azi])),
+            )
+        )
+
+    return routes
+
+
+def walk_path(
+    points: np.ndarray, step_m: float, loop: bool
+) -> Iterator[Tuple[float, float, float]]:
+    """Yield (lat, lon, azimuth) every `step_m` metres along the polyline; include endpoints."""
+    return iter_route(compute_route(points, step_m, loop))
+
+
+def iter_route(route: Route) -> Iterator[Tuple[float, float, float]]:
+    """
+    Yield (lat, lon, azimuth) of every fix of `route` as Python floats, converting
+    the arrays a chunk at a time rather than copying the whole route into lists.
+    """
+    lats, lons, azis = route
+    for i in range(0, len(lats), _ITER_CHUNK):
+        chunk = slice(i, i + _ITER_CHUNK)
+        yield from zip(lats[chunk].tolist(), lons[chunk].tolist(), azis[chunk].tolist())
 
 
-def total_path_distance(points: List[Tuple[float, float]], loop: bool = False) -> float:
+def total_path_distance(points: np.ndarray, loop: bool = False) -> float:
     """
     Return the total geodesic length (in metres) along the polyline defined by `points`.
     If loop=True, this “ping-pong”-walk (forward then back) is used, exactly as in walk_path.
     """
     if loop:
-        pts = points + points[-2::-1]
+        pts = np.concatenate((points, points[-2::-1]))
     else:
         pts = points
 
-    total = 0.0
-    for a, b in zip(pts, pts[1:]):
-        total += geod_dist(a, b)
-    return total
+    # every segment solved in one call instead of one Inverse per pair
+    return geod_line_length(pts[:, 1], pts[:, 0])
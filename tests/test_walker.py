@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+from core.walker import compute_route, compute_routes
+
+GENOA = np.array([[44.4040, 8.9460], [44.4050, 8.9480], [44.4030, 8.9500]])
+PORT = np.array([[44.4100, 8.9200], [44.4120, 8.9150]])
+EMPTY = np.empty((0, 2), dtype=np.float64)
+
+
+class TestComputeRoutes(unittest.TestCase):
+    def assertRouteEqual(self, route, expected):
+        for arr, exp in zip(route, expected):
+            np.testing.assert_array_equal(arr, exp)
+
+    def test_empty_track_does_not_break_the_batch(self):
+        # last in the batch too, where its endpoints would run off the array
+        for tracks in (
+            [(GENOA, 10.0, False), (EMPTY, 10.0, False), (PORT, 10.0, True)],
+            [(GENOA, 10.0, False), (PORT, 10.0, True), (EMPTY, 10.0, False)],
+        ):
+            routes = compute_routes(tracks)
+            for (points, step_m, loop), route in zip(tracks, routes):
+                if len(points):
+                    self.assertRouteEqual(route, compute_route(points, step_m, loop))
+                else:
+                    self.assertIsNone(route)
+
+    def test_zero_velocity_does_not_break_the_batch(self):
+        tracks = [(GENOA, 10.0, False), (PORT, 0.0, False), (PORT, 10.0, False)]
+        routes = compute_routes(tracks)
+        self.assertIsNone(routes[1])
+        self.assertRouteEqual(routes[0], compute_route(GENOA, 10.0, False))
+        self.assertRouteEqual(routes[2], compute_route(PORT, 10.0, False))
+
+    def test_cached_batch_skips_unwalkable_tracks(self):
+        routes = compute_routes([(EMPTY, 10.0, False), (GENOA, 0.0, False)], cache=True)
+        self.assertEqual(routes, [None, None])
+
+    def test_single_route_rejects_unwalkable_tracks(self):
+        for points, step_m in ((EMPTY, 10.0), (GENOA[:1], 10.0), (GENOA, 0.0)):
+            with self.assertRaises(ValueError):
+                compute_route(points, step_m, False)
+
+
+if __name__ == "__main__":
+    unittest.main()